@@ -1,8 +1,7 @@
 from fastapi import APIRouter, HTTPException
+from functools import lru_cache
 import os
 
-from analytics.kpi_calculator import KPICalculator
-
 router = APIRouter(prefix="/api/analytics", tags=["analytics"])
 
 DATABASE_URL = os.getenv(
@@ -11,11 +10,22 @@ DATABASE_URL = os.getenv(
 )
 
 
+@lru_cache(maxsize=1)
+def get_calculator():
+    """
+    Load the analytics engine on first use.
+    Keeps pandas/numpy out of API startup for processes that only ingest.
+    """
+    from analytics.kpi_calculator import KPICalculator
+
+    return KPICalculator(DATABASE_URL)
+
+
 @router.get("/kpis")
 def get_full_kpis(hours: int = 24):
     """Full KPI report."""
     try:
-        calc = KPICalculator(DATABASE_URL)
+        calc = get_calculator()
         return calc.generate_kpi_report(hours=hours)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analytics error: {str(e)}")
@@ -25,7 +35,7 @@ def get_full_kpis(hours: int = 24):
 def get_operational_kpis(hours: int = 24):
     """Operational KPIs only."""
     try:
-        calc = KPICalculator(DATABASE_URL)
+        calc = get_calculator()
         df = calc.get_events_dataframe(hours=hours)
         return calc.calculate_operational_kpis(df)
     except Exception as e:
@@ -1,4 +1,5 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean
+from sqlalchemy import create_engine, delete, insert, inspect, select, text, Column, Integer, String, Float, DateTime, Boolean
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker, declarative_base
 from datetime import datetime
 import os
@@ -18,6 +19,14 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Base class for ORM models
 Base = declarative_base()
 
+# Bump when a table/model is added, so init_db re-runs create_all.
+# create_all only creates missing tables (it never alters columns), and
+# forgetting the bump means new tables are silently skipped on existing DBs.
+SCHEMA_VERSION = 1
+
+# Arbitrary key for pg_advisory_xact_lock, serializes init_db across workers
+SCHEMA_LOCK_KEY = 7_663_001
+
 
 class APIEvent(Base):
     """
@@ -48,12 +57,55 @@ class KPISnapshot(Base):
     kpi_category = Column(String)                   # operational, security, delivery
 
 
+class SchemaVersion(Base):
+    """
+    Single row recording which SCHEMA_VERSION the tables were created for.
+    """
+    __tablename__ = "schema_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False)
+
+
+def get_schema_version():
+    """
+    Return the stored schema version, or None if it has never been recorded.
+    """
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(SchemaVersion.version)).scalar()
+    except SQLAlchemyError:
+        return None  # table does not exist yet
+
+
+def _schema_is_current(version) -> bool:
+    # A newer image may already have migrated further (rolling deploys):
+    # never re-run create_all for, or write back, an older version
+    return version is not None and version >= SCHEMA_VERSION
+
+
 def init_db():
     """
     Create tables in the database based on the models above.
-    Called at app startup.
+    Called at app startup; a single SELECT when the schema is already current.
     """
-    Base.metadata.create_all(bind=engine)
+    if _schema_is_current(get_schema_version()):
+        return
+
+    # Several workers/replicas may start together: take turns under a lock
+    with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
+
+        # Another worker may have finished while we waited for the lock
+        if inspect(conn).has_table(SchemaVersion.__tablename__):
+            if _schema_is_current(conn.execute(select(SchemaVersion.version)).scalar()):
+                return
+
+        # Stored version is missing or lower, so this only ever moves it forward
+        Base.metadata.create_all(bind=conn)
+        conn.execute(delete(SchemaVersion))
+        conn.execute(insert(SchemaVersion).values(id=1, version=SCHEMA_VERSION))
 
 
 # Dependency for FastAPI: get a database session
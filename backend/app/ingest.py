@@ -0,0 +1,118 @@
+"""
+Lean event ingest path.
+Writes events with a single Core INSERT ... RETURNING instead of going
+through the ORM unit of work (identity map, flush, refresh SELECT).
+"""
+
+import json
+import math
+from datetime import datetime
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from .database import APIEvent
+from .schemas import EventCreate
+
+
+class EventRecord:
+    """
+    Compact in-memory representation of one ingested event.
+    The timestamp is assigned here, so the database only has to hand back the id.
+    """
+    __slots__ = (
+        "id",
+        "timestamp",
+        "endpoint",
+        "method",
+        "status_code",
+        "response_time_ms",
+        "client_id",
+        "error_message",
+        "success",
+    )
+
+    def __init__(
+        self,
+        endpoint: str,
+        method: str,
+        status_code: int,
+        response_time_ms: float,
+        client_id: str,
+        error_message: str | None = None,
+        success: bool = True,
+        timestamp: datetime | None = None,
+        id: int | None = None,
+    ):
+        self.id = id
+        self.timestamp = timestamp or datetime.utcnow()
+        self.endpoint = endpoint
+        self.method = method
+        self.status_code = status_code
+        self.response_time_ms = response_time_ms
+        self.client_id = client_id
+        self.error_message = error_message
+        self.success = success
+
+    @classmethod
+    def from_schema(cls, event: EventCreate) -> "EventRecord":
+        """Build a record from a validated request body (no model_dump)."""
+        return cls(
+            event.endpoint,
+            event.method,
+            event.status_code,
+            event.response_time_ms,
+            event.client_id,
+            event.error_message,
+            event.success,
+        )
+
+    def insert_params(self) -> dict:
+        """Column values for the INSERT statement."""
+        return {
+            "timestamp": self.timestamp,
+            "endpoint": self.endpoint,
+            "method": self.method,
+            "status_code": self.status_code,
+            "response_time_ms": self.response_time_ms,
+            "client_id": self.client_id,
+            "error_message": self.error_message,
+            "success": self.success,
+        }
+
+
+# Built once at import; compiled statement is reused by SQLAlchemy's cache
+_INSERT_EVENT = insert(APIEvent.__table__).returning(APIEvent.__table__.c.id)
+
+# Same field order and output as EventResponse, without per-request validation.
+# Non-finite floats are mapped to None first, matching EventResponse.model_dump_json.
+# Deliberate change: the old endpoint returned 500 for them. allow_nan=False
+# guarantees a bare NaN/Infinity token can never reach a client.
+_encode = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode
+
+
+def insert_event(db: Session, record: EventRecord) -> EventRecord:
+    """
+    Insert one event and fill in its id. Caller is responsible for commit.
+    """
+    record.id = db.execute(_INSERT_EVENT, record.insert_params()).scalar_one()
+    return record
+
+
+def serialize_event(record: EventRecord) -> bytes:
+    """
+    Render a record as the EventResponse JSON body.
+    """
+    response_time_ms = record.response_time_ms
+    if not math.isfinite(response_time_ms):
+        response_time_ms = None
+    return _encode({
+        "id": record.id,
+        "timestamp": record.timestamp.isoformat(),
+        "endpoint": record.endpoint,
+        "method": record.method,
+        "status_code": record.status_code,
+        "response_time_ms": response_time_ms,
+        "client_id": record.client_id,
+        "success": record.success,
+    }).encode("utf-8")
@@ -9,6 +9,7 @@ from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_
 
 from .database import init_db, get_db, APIEvent
 from .schemas import EventCreate, EventResponse, StatusResponse
+from .ingest import EventRecord, insert_event, serialize_event
 
 app = FastAPI(
     title="VehicleConnect Cloud API",
@@ -90,11 +91,14 @@ def create_event(event: EventCreate, db: Session = Depends(get_db)):
         if not event.success:
             ERROR_COUNT.labels(endpoint=event.endpoint).inc()
 
-        db_event = APIEvent(**event.model_dump())
-        db.add(db_event)
+        # Lean path: Core INSERT ... RETURNING id, no ORM round trips
+        record = insert_event(db, EventRecord.from_schema(event))
         db.commit()
-        db.refresh(db_event)
-        return db_event
+        return Response(
+            content=serialize_event(record),
+            status_code=201,
+            media_type="application/json",
+        )
 
     except Exception as e:
         db.rollback()
@@ -0,0 +1,95 @@
+"""
+Ingest microbenchmark
+Compares per-event CPU time and allocations of the old ORM path
+(EventCreate -> model_dump -> APIEvent -> refresh -> EventResponse)
+with the lean Core path in app.ingest.
+
+Run from backend/:
+    python -m benchmarks.bench_ingest
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.bench_ingest
+"""
+
+import os
+import time
+import tracemalloc
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, APIEvent
+from app.ingest import EventRecord, insert_event, serialize_event
+from app.schemas import EventCreate, EventResponse
+
+BENCH_DATABASE_URL = os.getenv("BENCH_DATABASE_URL", "sqlite://")
+N_EVENTS = int(os.getenv("BENCH_EVENTS", "2000"))
+
+PAYLOAD = {
+    "endpoint": "/api/vehicle/status",
+    "method": "GET",
+    "status_code": 200,
+    "response_time_ms": 42.5,
+    "client_id": "vehicle_00042",
+    "success": True,
+}
+
+
+def orm_path(db, event: EventCreate) -> bytes:
+    db_event = APIEvent(**event.model_dump())
+    db.add(db_event)
+    db.commit()
+    db.refresh(db_event)
+    return EventResponse.model_validate(db_event).model_dump_json().encode("utf-8")
+
+
+def lean_path(db, event: EventCreate) -> bytes:
+    record = insert_event(db, EventRecord.from_schema(event))
+    db.commit()
+    return serialize_event(record)
+
+
+def run(name: str, fn, Session) -> None:
+    db = Session()
+    try:
+        # Warm up statement cache and connection
+        for _ in range(50):
+            fn(db, EventCreate(**PAYLOAD))
+
+        start = time.process_time()
+        for _ in range(N_EVENTS):
+            fn(db, EventCreate(**PAYLOAD))
+        cpu = time.process_time() - start
+
+        # Separate pass with tracing on: per-call peak and retained size
+        peak_total = 0
+        retained_total = 0
+        tracemalloc.start()
+        for _ in range(N_EVENTS):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            fn(db, EventCreate(**PAYLOAD))
+            after, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - before
+            retained_total += after - before
+        tracemalloc.stop()
+    finally:
+        db.close()
+
+    print(
+        f"{name:<6} {cpu / N_EVENTS * 1e6:9.1f} us/event CPU   "
+        f"peak {peak_total / N_EVENTS / 1024:7.2f} KiB/event   "
+        f"retained {retained_total / N_EVENTS:8.1f} B/event"
+    )
+
+
+def main():
+    engine = create_engine(BENCH_DATABASE_URL)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    print(f"📊 {N_EVENTS:,} events against {engine.url.get_backend_name()}")
+    run("orm", orm_path, Session)
+    run("lean", lean_path, Session)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Cold-start benchmark
+Measures how long a fresh interpreter takes to import the API app
+(what every uvicorn worker and --reload cycle pays), reports whether
+heavy analytics dependencies were pulled in, and times the init_db startup
+hook on a fresh and on an already-current database.
+
+Run from backend/:
+    python -m benchmarks.bench_startup
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.bench_startup
+
+Without BENCH_DATABASE_URL each run gets its own empty SQLite file. With it,
+the "fresh" timing is only the create path if that database starts empty.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DATABASE_URL = os.getenv("BENCH_DATABASE_URL")
+N_RUNS = int(os.getenv("BENCH_RUNS", "10"))
+BACKEND_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+PROBE = (
+    "import sys, app.main; "
+    "print(','.join(m for m in ('pandas', 'numpy') if m in sys.modules))"
+)
+
+# First call creates the schema (slow path, advisory lock on Postgres), second is the
+# single-SELECT fast path every restarted worker takes
+INIT_DB_PROBE = (
+    "import time; from app.database import init_db; "
+    "t0 = time.perf_counter(); init_db(); "
+    "t1 = time.perf_counter(); init_db(); "
+    "t2 = time.perf_counter(); "
+    "print(t1 - t0, t2 - t1)"
+)
+
+
+def cold_start() -> tuple[float, str]:
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=BACKEND_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return time.perf_counter() - start, out.strip()
+
+
+def init_db_timings(workdir: str) -> tuple[float, float]:
+    database_url = BENCH_DATABASE_URL or f"sqlite:///{os.path.join(workdir, 'startup.db')}"
+    out = subprocess.run(
+        [sys.executable, "-c", INIT_DB_PROBE],
+        cwd=BACKEND_ROOT,
+        env={**os.environ, "DATABASE_URL": database_url},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    fresh, current = out.split()
+    return float(fresh), float(current)
+
+
+def baseline() -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    interp = statistics.median(baseline() for _ in range(N_RUNS))
+    runs = [cold_start() for _ in range(N_RUNS)]
+    times = [t for t, _ in runs]
+    heavy = runs[-1][1] or "none"
+
+    print(f"🚀 import app.main over {N_RUNS} runs")
+    print(f"median {statistics.median(times) * 1000:8.1f} ms   "
+          f"min {min(times) * 1000:8.1f} ms   "
+          f"(bare interpreter {interp * 1000:.1f} ms)")
+    print(f"heavy modules loaded at startup: {heavy}")
+
+    fresh, current = [], []
+    for _ in range(N_RUNS):
+        with tempfile.TemporaryDirectory() as workdir:
+            f, c = init_db_timings(workdir)
+        fresh.append(f)
+        current.append(c)
+
+    print(f"🗄  init_db over {N_RUNS} runs")
+    print(f"fresh DB   median {statistics.median(fresh) * 1000:8.1f} ms")
+    print(f"current DB median {statistics.median(current) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from fastapi.testclient import TestClient
+from app.main import app
+from app.ingest import EventRecord, serialize_event
+from app.schemas import EventCreate, EventResponse
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("response_time_ms", [42.5, float("nan"), float("inf")])
+def test_serialize_event_matches_response_schema(response_time_ms):
+    """Pre-built serializer produces the same body as EventResponse"""
+    event = EventCreate(
+        endpoint="/api/vehicle/status",
+        method="GET",
+        status_code=200,
+        response_time_ms=response_time_ms,
+        client_id="vehicle_00042",
+    )
+    record = EventRecord.from_schema(event)
+    record.id = 7
+
+    body = serialize_event(record)
+    expected = EventResponse.model_validate(record).model_dump_json()
+    assert json.loads(body) == json.loads(expected)
+    # Strict JSON: non-finite floats must not leak out as NaN/Infinity tokens
+    json.loads(body, parse_constant=lambda token: pytest.fail(f"non-JSON token {token}"))
+
+
+def test_create_event_returns_id_and_timestamp():
+    """Lean ingest path still returns the generated id and timestamp"""
+    event_data = {
+        "endpoint": "/api/ingest",
+        "method": "POST",
+        "status_code": 500,
+        "response_time_ms": 120.0,
+        "client_id": "test_client",
+        "error_message": "boom",
+        "success": False,
+    }
+
+    response = client.post("/api/events", json=event_data)
+    assert response.status_code == 201
+    created = response.json()
+    assert isinstance(created["id"], int)
+    assert "timestamp" in created
+    assert created["success"] is False
+    assert "error_message" not in created
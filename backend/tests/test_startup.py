@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+
+from sqlalchemy import create_engine, inspect, select
+
+from app import database
+
+BACKEND_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def test_app_import_does_not_load_pandas():
+    """Analytics dependencies are loaded lazily, not at API startup"""
+    probe = "import sys, app.main; print('pandas' in sys.modules, 'numpy' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=BACKEND_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert out.strip() == "False False"
+
+
+def test_init_db_skips_create_all_when_schema_current(tmp_path, monkeypatch):
+    """init_db only runs create_all when the stored schema version is older"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    monkeypatch.setattr(database, "engine", engine)
+
+    create_all = database.Base.metadata.create_all
+    calls = []
+
+    def spy(*args, **kwargs):
+        calls.append(1)
+        return create_all(*args, **kwargs)
+
+    monkeypatch.setattr(database.Base.metadata, "create_all", spy)
+
+    # Fresh database: tables created and version recorded
+    database.init_db()
+    assert len(calls) == 1
+    tables = inspect(engine).get_table_names()
+    assert {"api_events", "kpi_snapshots", "schema_version"} <= set(tables)
+    assert database.get_schema_version() == database.SCHEMA_VERSION
+
+    # Same version: create_all skipped
+    database.init_db()
+    assert len(calls) == 1
+
+    # Bumped version: create_all runs again and the new version is stored
+    monkeypatch.setattr(database, "SCHEMA_VERSION", database.SCHEMA_VERSION + 1)
+    database.init_db()
+    assert len(calls) == 2
+    with engine.connect() as conn:
+        versions = conn.execute(select(database.SchemaVersion.version)).scalars().all()
+    assert versions == [database.SCHEMA_VERSION]
+
+    # Older image during a rolling deploy: stored version is newer, leave it alone
+    monkeypatch.setattr(database, "SCHEMA_VERSION", database.SCHEMA_VERSION - 1)
+    database.init_db()
+    assert len(calls) == 2
+    assert database.get_schema_version() == database.SCHEMA_VERSION + 1